@@ -1,10 +1,12 @@
+import functools
+import os
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 
 # Page config
 st.set_page_config(
@@ -35,23 +37,116 @@ plotly_template = {
     }
 }
 
-# Title styling
+# Shared figure layout, hoisted so Plotly validates it once per figure
+# construction instead of through a separate update_layout call
+BASE_LAYOUT = dict(
+    hovermode="x unified",
+    height=500,
+    template=plotly_template,
+    margin=dict(t=60, b=20)
+)
+
+# Title styling - the markup is interpolated once at import time, so each
+# call only formats the text in
+_TITLE_TMPL = (
+    "<div style='background-color:%s; color:white; padding:12px; "
+    "border-radius:8px; text-align:center; margin-bottom:20px; "
+    "font-size:24px; font-weight:bold;'>{}</div>" % COLOR_SCHEME["primary"]
+)
+
+_SIDEBAR_HEADER = (
+    "<div style='background-color:%s; color:white; padding:12px; "
+    "border-radius:8px; text-align:center; margin-bottom:20px; "
+    "font-size:18px; font-weight:bold;'>Financial Analytics Dashboard</div>"
+    % COLOR_SCHEME["primary"]
+)
+
+_BANNER_TMPL = (
+    "<div style='color:%s; font-size:14px; margin-bottom:10px;'>{}</div>"
+    % COLOR_SCHEME["primary"]
+)
+
+# Config for charts that are read at a glance: skipping the interactive
+# plotly.js event wiring and the mode bar cuts per-figure browser cost
+STATIC_CHART = {'staticPlot': True, 'displayModeBar': False}
+
 def styled_title(text):
-    st.markdown(
-        f"""<div style='background-color:{COLOR_SCHEME["primary"]}; 
-                color:white; 
-                padding:12px;
-                border-radius:8px;
-                text-align:center;
-                margin-bottom:20px;
-                font-size:24px;
-                font-weight:bold;'>
-            {text}
-        </div>""",
-        unsafe_allow_html=True
-    )
+    st.markdown(_TITLE_TMPL.format(text), unsafe_allow_html=True)
 
-# Metric card component
+# Card styling lives in one <style> block injected below; each card only
+# ships semantic markup instead of ~500 bytes of repeated inline CSS
+_CARD_CSS = f"""
+    <style>
+        .metric-card {{
+            background: {COLOR_SCHEME["card_background"]};
+            padding: 1.2rem;
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            text-align: center;
+            border-left: 4px solid {COLOR_SCHEME["accent"]};
+            height: 140px;
+            display: flex;
+            flex-direction: column;
+            justify-content: space-between;
+        }}
+        .metric-card .title {{
+            font-size: 1rem;
+            color: {COLOR_SCHEME["secondary"]};
+            font-weight: 500;
+        }}
+        .metric-card .value {{
+            font-size: 1.8rem;
+            color: {COLOR_SCHEME["primary"]};
+            font-weight: bold;
+        }}
+        .metric-card .change {{
+            font-size: 0.9rem;
+            font-weight: 500;
+        }}
+    </style>
+"""
+
+# App-wide chrome styling, interpolated once at import time. Previously an
+# f-string rebuilt at the bottom of every rerun
+_APP_CSS = f"""
+    <style>
+        .stApp {{
+            background-color: {COLOR_SCHEME["background"]};
+        }}
+        .stPlotlyChart {{
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            padding: 15px;
+            background-color: {COLOR_SCHEME["card_background"]};
+        }}
+        .css-1v3fvcr {{
+            padding-top: 1.5rem;
+        }}
+        .stDataFrame {{
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+    </style>
+"""
+
+# One markdown element for all styling, emitted at the top of every run.
+# Deliberately not guarded by session_state or cache_resource: Streamlit
+# drops elements that aren't re-emitted on rerun, so skipping the call
+# would strip the styles from the page
+def inject_css():
+    st.markdown(_APP_CSS + _CARD_CSS, unsafe_allow_html=True)
+
+_CARD_TMPL = (
+    "<div class='metric-card'>"
+    "<div class='title'>{title}</div>"
+    "<div class='value'>{value_display}</div>"
+    "<div class='change' style='color:{change_color}'>{change_text}</div>"
+    "</div>"
+)
+
+# Metric card component - pure function of its args, so memoized across
+# Streamlit reruns
+@functools.lru_cache(maxsize=512)
 def create_metric_card(title, value, change=None, change_pct=None, icon="📊"):
     arrow = ""
     change_color = COLOR_SCHEME["neutral"]
@@ -73,65 +168,386 @@ def create_metric_card(title, value, change=None, change_pct=None, icon="📊"):
         change_color = COLOR_SCHEME["positive"] if change >= 0 else COLOR_SCHEME["negative"]
         change_text = f"{arrow} {abs(change):,.2f} ({abs(change_pct):.1f}%)"
 
-    return f"""
-    <div style="
-        background: {COLOR_SCHEME["card_background"]};
-        padding: 1.2rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        text-align: center;
-        border-left: 4px solid {COLOR_SCHEME["accent"]};
-        height: 140px;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-    ">
-        <div style="font-size: 1rem; color: {COLOR_SCHEME["secondary"]}; font-weight: 500;">{title}</div>
-        <div style="font-size: 1.8rem; color: {COLOR_SCHEME["primary"]}; font-weight: bold;">{value_display}</div>
-        <div style="color: {change_color}; font-size: 0.9rem; font-weight: 500;">{change_text}</div>
-    </div>
-    """
+    return _CARD_TMPL.format(
+        title=title,
+        value_display=value_display,
+        change_color=change_color,
+        change_text=change_text
+    )
+
+# Vectorized form of the card value formatter: formats a batch of values
+# from the same column in a single pass instead of branching per card
+def format_values(values):
+    arr = np.asarray(values, dtype=float)
+    mag = np.abs(arr)
+    div = np.where(mag >= 1e6, 1e6, np.where(mag >= 1e3, 1e3, 1.0))
+    suffix = np.where(mag >= 1e6, 'M', np.where(mag >= 1e3, 'K', ''))
+    return [f"${v / d:,.1f}{s}" if s else f"{v:,.2f}"
+            for v, d, s in zip(arr, div, suffix)]
 
-# Load financial data
+# One Streamlit element per card row - a CSS grid in a single markdown call
+# replaces st.columns plus one markdown element per card
+def card_row(cards):
+    st.markdown(
+        "<div style='display:grid;grid-template-columns:repeat(%d,1fr);gap:1rem'>%s</div>"
+        % (len(cards), "".join(cards)),
+        unsafe_allow_html=True
+    )
+
+# Each titled section renders inside its own st.fragment, so Streamlit
+# re-executes only the fragment an interaction belongs to instead of the
+# whole page
+@st.fragment
+def render_section(title, cards, fig=None):
+    styled_title(title)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True)
+    card_row(cards)
+
+# Columns summarised on each dashboard page
+FINANCIAL_COLS = [
+    'Total Revenue', 'Total Assets', 'Total Liabilities', 'Long Term Debt',
+    'Shareholders_Equity', 'Return on Equity', 'Return on Assets', 'Return on Investment'
+]
+COMMODITY_COLS = ['CPI', 'GDP', 'Oil', 'Copper']
+
+# Optional Numba kernel fusing all six reductions into one cache-resident
+# loop over the 2-D array; the JIT dispatch cost is amortized because the
+# same compiled kernel serves both pages across the whole session
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _stats_kernel(arr):
+        n, m = arr.shape
+        out = np.empty((m, 6))
+        for j in range(m):
+            mn = np.inf
+            mx = -np.inf
+            total = 0.0
+            for i in range(n):
+                v = arr[i, j]
+                total += v
+                mn = min(mn, v)
+                mx = max(mx, v)
+            out[j, 0] = mn
+            out[j, 1] = mx
+            out[j, 2] = total / n
+            out[j, 3] = total
+            out[j, 4] = arr[n - 1, j]
+            out[j, 5] = arr[n - 2, j] if n > 1 else arr[n - 1, j]
+        return out
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Optional numexpr reduction path: its threaded SIMD kernels beat the
+# single-threaded NumPy loop once the column no longer fits in cache.
+# Installing it also lets pandas route its own expression evaluation
+# through the same engine
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
+def _fast_mean(arr):
+    if _HAS_NUMEXPR:
+        return ne.evaluate('sum(arr)').item() / arr.size
+    return float(arr.mean())
+
+# Per-column stats (min/max/mean/sum/last/prev) in a single vectorized pass,
+# cached so Streamlit reruns don't re-scan the columns
+@st.cache_data
+def column_stats(df, cols):
+    arr = df[list(cols)].to_numpy(dtype=float)
+    if _HAS_NUMBA:
+        table = _stats_kernel(arr)
+        return {col: dict(zip(('min', 'max', 'mean', 'sum', 'last', 'prev'), table[i]))
+                for i, col in enumerate(cols)}
+    stats = {}
+    for i, col in enumerate(cols):
+        vals = arr[:, i]
+        stats[col] = {
+            'min': np.nanmin(vals),
+            'max': np.nanmax(vals),
+            'mean': np.nanmean(vals),
+            'sum': np.nansum(vals),
+            'last': vals[-1],
+            'prev': vals[-2] if len(vals) > 1 else vals[-1],
+        }
+    return stats
+
+# Data Explorer table with the numeric columns pre-formatted as strings in
+# one vectorized pass. Styler.format walked every cell in Python on each
+# rerun; this runs once and the frontend renders the strings directly
+@st.cache_data
+def explorer_table(df):
+    table = df.rename(columns={"Shareholders_Equity": "Shareholder's Equity"})
+    num_cols = [col for col in table.columns if col != 'Date']
+    table[num_cols] = table[num_cols].map('{:,.2f}'.format)
+    return table
+
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# Combined frame for the Filtered Visualizations page, built once per
+# session. .assign keeps the inputs untouched - they are shared,
+# cache-backed frames - and the year/month columns are derived here so
+# widget interactions never redo the concat or the datetime accessors
+@st.cache_data
+def build_combined(fin_df, com_df):
+    combined = pd.concat([fin_df.assign(source='financial'),
+                          com_df.assign(source='commodities')],
+                         ignore_index=True, copy=False)
+    combined['year'] = combined['Date'].dt.year.astype('int16')
+    # Month stays a plain 1-12 int - dt.month is a fast C path, whereas
+    # month_name() plus Categorical construction string-categorizes the
+    # whole column. Names are mapped onto the 12-row aggregate instead
+    combined['month'] = combined['Date'].dt.month.astype('int8')
+    return combined
+
+# Aggregate every numeric column over both sources and the chosen time
+# key in one cached pass - flipping through the metric dropdown then just
+# indexes into the batched result instead of re-grouping per column, and
+# dataset toggles slice a handful of aggregated rows instead of
+# boolean-masking the full frame before grouping
+@st.cache_data
+def preagg(df, time_key):
+    cols = numeric_columns(df)
+    if time_key == 'month':
+        # The 1-12 int month provides group codes for free, so the
+        # per-source monthly means reduce to bincount passes sharing
+        # one set of group codes across all columns - a NumPy sweep
+        # instead of pandas' general groupby machinery
+        month_codes = df['month'].to_numpy() - 1
+        src_codes, src_labels = pd.factorize(df['source'])
+        base = src_codes * 12 + month_codes
+        nbins = 12 * len(src_labels)
+        vals = df[cols].to_numpy(dtype=float)
+        mask = ~np.isnan(vals)
+        sums = np.empty((nbins, len(cols)))
+        counts = np.empty((nbins, len(cols)))
+        for j in range(len(cols)):
+            codes = base[mask[:, j]]
+            sums[:, j] = np.bincount(codes, weights=vals[mask[:, j], j],
+                                     minlength=nbins)
+            counts[:, j] = np.bincount(codes, minlength=nbins)
+        idx = np.nonzero(np.bincount(base, minlength=nbins))[0]
+        # Groups a column has no data for come out NaN and are dropped at
+        # selection time
+        with np.errstate(invalid='ignore'):
+            means = sums[idx] / counts[idx]
+        # idx is sorted by (source, month int), so calendar order falls out
+        # for free; the name lookup runs over at most 12 rows per source
+        agg = pd.DataFrame(means, columns=cols)
+        agg.insert(0, 'month', np.take(MONTH_ORDER, idx % 12))
+        agg.insert(0, 'source', src_labels.take(idx // 12))
+        return agg
+    # observed=True keeps the result at the groups that actually occur -
+    # without it pandas allocates the full category cross-product whenever
+    # a Categorical key is in play
+    # as_index=False yields the flat frame directly, skipping the
+    # Series-then-reset_index intermediate
+    return df.groupby(['source', time_key], as_index=False, observed=True)[cols].mean()
+
+# Numeric metric options for the filter widgets - dtypes are stable for
+# the session, so the per-rerun dtype scan collapses to one cached call.
+# include='number' also picks up narrowed dtypes (float32/int16), which
+# the old float64/int64 filter silently dropped
 @st.cache_data
+def numeric_columns(df):
+    return [col for col in df.select_dtypes(include='number').columns
+            if col not in ('year', 'month', 'source')]
+
+# Sentiment column detection and its mean, resolved once - both were
+# re-derived from the static sentiment frame on every rerun
+@st.cache_data
+def sentiment_meta(df):
+    for col in ('sentiment_score', 'sentiment', 'score', 'sentiment score'):
+        if col in df.columns:
+            return col, _fast_mean(df[col].to_numpy(dtype=float))
+    return None, None
+
+# Sentiment class counts, bucketized in one vectorized pass and cached -
+# the cards and pie previously showed hardcoded placeholder counts
+@st.cache_data
+def sentiment_buckets(df, col):
+    arr = df[col].to_numpy(dtype=float)
+    pos = int((arr > 0.05).sum())
+    neg = int((arr < -0.05).sum())
+    neu = len(arr) - pos - neg
+    return pos, neu, neg
+
+# Figure builders cached on their actual inputs. px.histogram/px.pie/px.bar
+# do nontrivial Python-side trace and layout assembly, so unchanged widget
+# states reuse the finished figure instead of rebuilding it per rerun
+@st.cache_data
+def make_hist(df, col, mean_score):
+    fig = px.histogram(
+        df,
+        x=col,
+        nbins=30,
+        title='Sentiment Score Distribution',
+        labels={col: 'Sentiment Score', 'count': 'Count'},
+        color_discrete_sequence=[COLOR_SCHEME["primary"]]
+    )
+    fig.add_vline(
+        x=0,
+        line_dash="dot",
+        line_color=COLOR_SCHEME["neutral"],
+        annotation_text="Neutral",
+        annotation_position="bottom right"
+    )
+    fig.add_vline(
+        x=mean_score,
+        line_dash="dash",
+        line_color=COLOR_SCHEME["negative"],
+        annotation_text=f"Mean: {mean_score:.2f}",
+        annotation_position="top right"
+    )
+    fig.update_layout(
+        height=400,
+        template=plotly_template,
+        bargap=0.1
+    )
+    return fig
+
+@st.cache_data
+def make_pie(counts):
+    pie_data = pd.DataFrame({
+        'sentiment': ['Positive', 'Neutral', 'Negative'],
+        'count': list(counts)
+    })
+    fig = px.pie(
+        pie_data,
+        names='sentiment',
+        values='count',
+        title='Sentiment Distribution',
+        color='sentiment',
+        color_discrete_map={
+            'Positive': COLOR_SCHEME["positive"],
+            'Neutral': COLOR_SCHEME["neutral"],
+            'Negative': COLOR_SCHEME["negative"]
+        },
+        hole=0.3
+    )
+    fig.update_traces(
+        textinfo='percent+value',
+        textposition='inside',
+        marker=dict(line=dict(color='white', width=1))
+    )
+    fig.update_layout(
+        height=400,
+        template=plotly_template,
+        showlegend=False,
+        margin=dict(t=50, b=20)
+    )
+    return fig
+
+@st.cache_data
+def make_bar(agg_df, x_col, column, title):
+    fig = px.bar(
+        agg_df,
+        x=x_col,
+        y=column,
+        title=title,
+        color=column,
+        color_continuous_scale=px.colors.sequential.Viridis,
+        labels={column: column, x_col: 'Time Period'}
+    )
+    fig.update_layout(
+        height=500,
+        xaxis_title="Time Period",
+        yaxis_title=column,
+        template=plotly_template,
+        margin=dict(t=60, b=100),
+        coloraxis_showscale=True
+    )
+    # Rotate x-axis labels for better readability
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+# PyArrow's CSV reader is multithreaded and parses dates inline; fall back to
+# the default C engine when pyarrow isn't installed
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+def read_csv_fast(file_path, date_col=None):
+    if _HAS_PYARROW:
+        # Convert once to Parquet and read that afterwards - columnar, typed
+        # and compressed, so cold loads skip CSV parsing entirely
+        parquet_path = file_path.replace('.csv', '.parquet')
+        if os.path.exists(parquet_path):
+            return pd.read_parquet(parquet_path)
+        parse_dates = [date_col] if date_col else None
+        data = pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow',
+                           parse_dates=parse_dates)
+        data.to_parquet(parquet_path)
+        return data
+    data = pd.read_csv(file_path)
+    if date_col:
+        data[date_col] = pd.to_datetime(data[date_col])
+    return data
+
+# Narrow the default 64-bit numerics; the charts and cards only need ~6
+# significant digits, and every downstream reduction and groupby moves
+# half the bytes per element. Columns read with the pyarrow backend stay
+# Arrow-backed through the narrowing - Streamlit serialises frames via
+# Arrow, so these skip a pandas-to-Arrow conversion on every render
+def downcast_numeric(data):
+    for col in data.columns:
+        dtype = data[col].dtype
+        if pd.api.types.is_float_dtype(dtype):
+            target = 'float32[pyarrow]' if isinstance(dtype, pd.ArrowDtype) else 'float32'
+            data[col] = data[col].astype(target)
+        elif pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.ArrowDtype):
+            data[col] = pd.to_numeric(data[col], downcast='integer')
+    return data
+
+# Load financial data
+@st.cache_resource
 def load_financial_data():
     file_path =r'financials_cleaned_for_plots.csv'
     try:
-        data = pd.read_csv(file_path)
-        data['Date'] = pd.to_datetime(data['Date'])
-        data = data.rename(columns={"Shareholder's Equity": "Shareholders_Equity"})
-        return data
+        data = read_csv_fast(file_path, date_col='Date')
+        # In-place rename: no need to copy the whole frame for a new label
+        data.rename(columns={"Shareholder's Equity": "Shareholders_Equity"}, inplace=True)
+        return downcast_numeric(data)
     except FileNotFoundError:
         st.error(f"Financial data file not found at: {file_path}")
         return pd.DataFrame()
 
 # Load commodities data
-@st.cache_data
+@st.cache_resource
 def load_commodities_data():
     file_path =r'commodities.csv'
 
     try:
-        data = pd.read_csv(file_path)
-        data['Date'] = pd.to_datetime(data['Date'])
-        # Rename columns for better understanding
-        data = data.rename(columns={
+        data = read_csv_fast(file_path, date_col='Date')
+        # Rename columns for better understanding (in place, no copy)
+        data.rename(columns={
             'CPIAUCSL': 'CPI',
             'WTISPLC': 'Oil',
             'PCOPPUSDM': 'Copper',
             'GDP': 'GDP'
-        })
-        return data
+        }, inplace=True)
+        return downcast_numeric(data)
     except FileNotFoundError:
         st.error(f"Commodities data file not found at: {file_path}")
         return pd.DataFrame()
 
 # Load sentiment data
-@st.cache_data
+@st.cache_resource
 def load_sentiment_data():
     file_path = r'senti.csv'
 
     try:
-        data = pd.read_csv(file_path)
+        data = read_csv_fast(file_path)
         if 'date' in data.columns:
             data['date'] = pd.to_datetime(data['date'])
         return data
@@ -139,886 +555,19 @@ def load_sentiment_data():
         st.error(f"Sentiment data file not found at: {file_path}")
         return pd.DataFrame()
 
-# Load data
-financial_df = load_financial_data()
-commodities_df = load_commodities_data()
-sentiment_df = load_sentiment_data()
-
-# Sidebar navigation
-st.sidebar.markdown(f"""
-    <div style='background-color:{COLOR_SCHEME["primary"]}; 
-                color:white; 
-                padding:12px;
-                border-radius:8px;
-                text-align:center;
-                margin-bottom:20px;
-                font-size:18px;
-                font-weight:bold;'>
-        Financial Analytics Dashboard
-    </div>
-""", unsafe_allow_html=True)
-
-pages = {
-    "📈 Financial Metrics": "metrics",
-    "📊 Data Explorer": "explorer",
-    "🛢️ Commodities & Macro": "commodities",
-    "📰 News Sentiments": "sentiments",
-    "📊 Filtered Visualizations": "filtered_visuals"  # Add this new line
-}
-selected_page = st.sidebar.radio("Navigation", list(pages.keys()))
-
-# === FINANCIAL METRICS PAGE ===
-if selected_page == "📈 Financial Metrics":
-    styled_title("Financial Performance Dashboard")
-    
-    if not financial_df.empty:
-        # Summary cards at top
-        latest_date = financial_df['Date'].max().strftime('%b %Y')
-        st.markdown(f"""
-            <div style='color:{COLOR_SCHEME["primary"]}; 
-                        font-size:14px;
-                        margin-bottom:10px;'>
-                <b>Scenario Analysis Active</b> | Years: {financial_df['Date'].min().year}-{financial_df['Date'].max().year} | 
-                Showing {len(financial_df)} of {len(financial_df)} records | Latest: {latest_date}
-            </div>
-        """, unsafe_allow_html=True)
-        
-        # Calculate metrics for top cards
-        latest_rev = financial_df['Total Revenue'].iloc[-1]
-        prev_rev = financial_df['Total Revenue'].iloc[-2] if len(financial_df) > 1 else latest_rev
-        rev_change = latest_rev - prev_rev
-        rev_change_pct = (rev_change / prev_rev) * 100 if prev_rev != 0 else 0
-        
-        latest_assets = financial_df['Total Assets'].iloc[-1]
-        avg_assets = financial_df['Total Assets'].mean()
-        
-        latest_roe = financial_df['Return on Equity'].iloc[-1]
-        target_roe = 15.0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Revenue", 
-                latest_rev, 
-                rev_change, 
-                rev_change_pct,
-                "💰"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Avg. Monthly Assets", 
-                avg_assets,
-                icon="🏦"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Total Assets (Period)", 
-                financial_df['Total Assets'].sum(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "ROE vs Target", 
-                latest_roe,
-                latest_roe - target_roe,
-                ((latest_roe - target_roe)/target_roe)*100,
-                "🎯"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # ASSETS SECTION
-        styled_title("Assets Analysis")
-        
-        # Assets Chart
-        fig_assets = go.Figure()
-        fig_assets.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Total Assets'], 
-            name="Total Assets", 
-            line=dict(color=COLOR_SCHEME["primary"], width=3)
-        ))
-        fig_assets.update_layout(
-            title="Total Assets Over Time",
-            xaxis_title="Date",
-            yaxis_title="Amount ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_assets, use_container_width=True)
-        
-        # Assets Metrics
-        latest_assets = financial_df['Total Assets'].iloc[-1]
-        prev_assets = financial_df['Total Assets'].iloc[-2] if len(financial_df) > 1 else latest_assets
-        assets_change = latest_assets - prev_assets
-        assets_change_pct = (assets_change / prev_assets) * 100 if prev_assets != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Assets", 
-                latest_assets, 
-                assets_change, 
-                assets_change_pct,
-                "🏦"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Assets", 
-                financial_df['Total Assets'].max(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Assets", 
-                financial_df['Total Assets'].min(),
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Assets", 
-                financial_df['Total Assets'].mean(),
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # LIABILITIES SECTION
-        styled_title("Liabilities Analysis")
-        
-        # Liabilities Chart
-        fig_liab = go.Figure()
-        fig_liab.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Total Liabilities'], 
-            name="Total Liabilities", 
-            line=dict(color=COLOR_SCHEME["secondary"], width=3)
-        ))
-        fig_liab.update_layout(
-            title="Total Liabilities Over Time",
-            xaxis_title="Date",
-            yaxis_title="Amount ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_liab, use_container_width=True)
-        
-        # Liabilities Metrics
-        latest_liab = financial_df['Total Liabilities'].iloc[-1]
-        prev_liab = financial_df['Total Liabilities'].iloc[-2] if len(financial_df) > 1 else latest_liab
-        liab_change = latest_liab - prev_liab
-        liab_change_pct = (liab_change / prev_liab) * 100 if prev_liab != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Liabilities", 
-                latest_liab, 
-                liab_change, 
-                liab_change_pct,
-                "🏦"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Liabilities", 
-                financial_df['Total Liabilities'].max(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Liabilities", 
-                financial_df['Total Liabilities'].min(),
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Liabilities", 
-                financial_df['Total Liabilities'].mean(),
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # REVENUE SECTION
-        styled_title("Revenue Analysis")
-        
-        # Revenue Chart
-        fig_rev = go.Figure()
-        fig_rev.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Total Revenue'], 
-            name="Total Revenue", 
-            line=dict(color=COLOR_SCHEME["accent"], width=3)
-        ))
-        fig_rev.update_layout(
-            title="Total Revenue Over Time",
-            xaxis_title="Date",
-            yaxis_title="Amount ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_rev, use_container_width=True)
-        
-        # Revenue Metrics
-        latest_rev = financial_df['Total Revenue'].iloc[-1]
-        prev_rev = financial_df['Total Revenue'].iloc[-2] if len(financial_df) > 1 else latest_rev
-        rev_change = latest_rev - prev_rev
-        rev_change_pct = (rev_change / prev_rev) * 100 if prev_rev != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Revenue", 
-                latest_rev, 
-                rev_change, 
-                rev_change_pct,
-                "💰"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Revenue", 
-                financial_df['Total Revenue'].max(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Revenue", 
-                financial_df['Total Revenue'].min(),
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Revenue", 
-                financial_df['Total Revenue'].mean(),
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # DEBT SECTION
-        styled_title("Debt Analysis")
-        
-        # Debt Chart
-        fig_debt = go.Figure()
-        fig_debt.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Long Term Debt'], 
-            name="Long Term Debt", 
-            line=dict(color="#8e44ad", width=3)
-        ))
-        fig_debt.update_layout(
-            title="Long Term Debt Over Time",
-            xaxis_title="Date",
-            yaxis_title="Amount ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_debt, use_container_width=True)
-        
-        # Debt Metrics
-        latest_debt = financial_df['Long Term Debt'].iloc[-1]
-        prev_debt = financial_df['Long Term Debt'].iloc[-2] if len(financial_df) > 1 else latest_debt
-        debt_change = latest_debt - prev_debt
-        debt_change_pct = (debt_change / prev_debt) * 100 if prev_debt != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Debt", 
-                latest_debt, 
-                debt_change, 
-                debt_change_pct,
-                "🏦"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Debt", 
-                financial_df['Long Term Debt'].max(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Debt", 
-                financial_df['Long Term Debt'].min(),
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Debt", 
-                financial_df['Long Term Debt'].mean(),
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # EQUITY SECTION
-        styled_title("Equity Analysis")
-        
-        # Equity Chart
-        fig_equity = go.Figure()
-        fig_equity.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Shareholders_Equity'], 
-            name="Shareholder's Equity", 
-            line=dict(color="#16a085", width=3)
-        ))
-        fig_equity.update_layout(
-            title="Shareholder's Equity Over Time",
-            xaxis_title="Date",
-            yaxis_title="Amount ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_equity, use_container_width=True)
-        
-        # Equity Metrics
-        latest_equity = financial_df['Shareholders_Equity'].iloc[-1]
-        prev_equity = financial_df['Shareholders_Equity'].iloc[-2] if len(financial_df) > 1 else latest_equity
-        equity_change = latest_equity - prev_equity
-        equity_change_pct = (equity_change / prev_equity) * 100 if prev_equity != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Equity", 
-                latest_equity, 
-                equity_change, 
-                equity_change_pct,
-                "🏦"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Equity", 
-                financial_df['Shareholders_Equity'].max(),
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Equity", 
-                financial_df['Shareholders_Equity'].min(),
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Equity", 
-                financial_df['Shareholders_Equity'].mean(),
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # RETURN METRICS SECTION
-        styled_title("Return Metrics Analysis")
-        
-        # Return Metrics Chart
-        fig_returns = go.Figure()
-        fig_returns.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Return on Equity'], 
-            name="ROE", 
-            line=dict(color=COLOR_SCHEME["primary"], width=3)
-        ))
-        fig_returns.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Return on Assets'], 
-            name="ROA", 
-            line=dict(color=COLOR_SCHEME["secondary"], width=3)
-        ))
-        fig_returns.add_trace(go.Scatter(
-            x=financial_df['Date'], 
-            y=financial_df['Return on Investment'], 
-            name="ROI", 
-            line=dict(color=COLOR_SCHEME["accent"], width=3)
-        ))
-        fig_returns.add_hline(
-            y=target_roe, 
-            line_dash="dot", 
-            line_color=COLOR_SCHEME["negative"],
-            annotation_text=f"Target ROE: {target_roe}%",
-            annotation_position="top right"
-        )
-        fig_returns.update_layout(
-            title="Return Metrics Over Time",
-            xaxis_title="Date",
-            yaxis_title="Percentage",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_returns, use_container_width=True)
-        
-        # Return Metrics
-        latest_roe = financial_df['Return on Equity'].iloc[-1]
-        latest_roa = financial_df['Return on Assets'].iloc[-1]
-        latest_roi = financial_df['Return on Investment'].iloc[-1]
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest ROE", 
-                latest_roe,
-                icon="📊"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Latest ROA", 
-                latest_roa,
-                icon="📊"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Latest ROI", 
-                latest_roi,
-                icon="📊"
-            ), unsafe_allow_html=True)
-    else:
-        st.warning("No financial data available")
-
-# === DATA EXPLORER PAGE ===
-elif selected_page == "📊 Data Explorer":
-    styled_title("Financial Data Explorer")
-    
-    if not financial_df.empty:
-        # Display and filter data
-        display_df = financial_df.rename(columns={"Shareholders_Equity": "Shareholder's Equity"})
-        
-        st.dataframe(
-            display_df.style.format(
-                formatter="{:,.2f}",
-                subset=[col for col in display_df.columns if col not in ['Date']]
-            ),
-            height=600
-        )
-    else:
-        st.warning("No financial data available")
-
-# === COMMODITIES & MACRO PAGE ===
-elif selected_page == "🛢️ Commodities & Macro":
-    styled_title("Commodities & Macroeconomic Factors Dashboard")
-    
-    if not commodities_df.empty:
-        latest_date = commodities_df['Date'].max().strftime('%b %Y')
-        st.markdown(f"""
-            <div style='color:{COLOR_SCHEME["primary"]}; 
-                        font-size:14px;
-                        margin-bottom:10px;'>
-                Showing {len(commodities_df)} records | Latest: {latest_date}
-            </div>
-        """, unsafe_allow_html=True)
-        
-        # Calculate metrics for top cards
-        latest_cpi = commodities_df['CPI'].iloc[-1]
-        prev_cpi = commodities_df['CPI'].iloc[-2] if len(commodities_df) > 1 else latest_cpi
-        cpi_change = latest_cpi - prev_cpi
-        cpi_change_pct = (cpi_change / prev_cpi) * 100 if prev_cpi != 0 else 0
-        
-        latest_gdp = commodities_df['GDP'].iloc[-1]
-        avg_gdp = commodities_df['GDP'].mean()
-        
-        latest_oil = commodities_df['Oil'].iloc[-1]
-        latest_copper = commodities_df['Copper'].iloc[-1]
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest CPI", 
-                f"{latest_cpi:.2f}", 
-                cpi_change, 
-                cpi_change_pct,
-                "📉"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Avg. GDP", 
-                f"{avg_gdp:,.2f}",
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Oil Price", 
-                f"{latest_oil:.2f}",
-                icon="🛢️"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Copper Price", 
-                f"{latest_copper:.2f}",
-                icon="🔶"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # CPI SECTION
-        styled_title("Consumer Price Index (CPI)")
-        
-        # CPI Chart
-        fig_cpi = go.Figure()
-        fig_cpi.add_trace(go.Scatter(
-            x=commodities_df['Date'], 
-            y=commodities_df['CPI'], 
-            name="CPI", 
-            line=dict(color=COLOR_SCHEME["primary"], width=3)
-        ))
-        fig_cpi.update_layout(
-            title="CPI Over Time",
-            xaxis_title="Date",
-            yaxis_title="Index Value",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_cpi, use_container_width=True)
-        
-        # CPI Metrics
-        latest_cpi = commodities_df['CPI'].iloc[-1]
-        prev_cpi = commodities_df['CPI'].iloc[-2] if len(commodities_df) > 1 else latest_cpi
-        cpi_change = latest_cpi - prev_cpi
-        cpi_change_pct = (cpi_change / prev_cpi) * 100 if prev_cpi != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest CPI", 
-                f"{latest_cpi:.2f}", 
-                cpi_change, 
-                cpi_change_pct,
-                "📉"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max CPI", 
-                f"{commodities_df['CPI'].max():.2f}",
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min CPI", 
-                f"{commodities_df['CPI'].min():.2f}",
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. CPI", 
-                f"{commodities_df['CPI'].mean():.2f}",
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # GDP SECTION
-        styled_title("Gross Domestic Product (GDP)")
-        
-        # GDP Chart
-        fig_gdp = go.Figure()
-        fig_gdp.add_trace(go.Scatter(
-            x=commodities_df['Date'], 
-            y=commodities_df['GDP'], 
-            name="GDP", 
-            line=dict(color=COLOR_SCHEME["secondary"], width=3)
-        ))
-        fig_gdp.update_layout(
-            title="GDP Over Time",
-            xaxis_title="Date",
-            yaxis_title="Value",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_gdp, use_container_width=True)
-        
-        # GDP Metrics
-        latest_gdp = commodities_df['GDP'].iloc[-1]
-        prev_gdp = commodities_df['GDP'].iloc[-2] if len(commodities_df) > 1 else latest_gdp
-        gdp_change = latest_gdp - prev_gdp
-        gdp_change_pct = (gdp_change / prev_gdp) * 100 if prev_gdp != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest GDP", 
-                f"{latest_gdp:,.2f}", 
-                gdp_change, 
-                gdp_change_pct,
-                "📈"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max GDP", 
-                f"{commodities_df['GDP'].max():,.2f}",
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min GDP", 
-                f"{commodities_df['GDP'].min():,.2f}",
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. GDP", 
-                f"{commodities_df['GDP'].mean():,.2f}",
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # OIL SECTION
-        styled_title("Oil Prices")
-        
-        # Oil Chart
-        fig_oil = go.Figure()
-        fig_oil.add_trace(go.Scatter(
-            x=commodities_df['Date'], 
-            y=commodities_df['Oil'], 
-            name="Oil Price", 
-            line=dict(color="#8e44ad", width=3)
-        ))
-        fig_oil.update_layout(
-            title="Oil Prices Over Time",
-            xaxis_title="Date",
-            yaxis_title="Price per Barrel ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_oil, use_container_width=True)
-        
-        # Oil Metrics
-        latest_oil = commodities_df['Oil'].iloc[-1]
-        prev_oil = commodities_df['Oil'].iloc[-2] if len(commodities_df) > 1 else latest_oil
-        oil_change = latest_oil - prev_oil
-        oil_change_pct = (oil_change / prev_oil) * 100 if prev_oil != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Oil Price", 
-                f"{latest_oil:.2f}", 
-                oil_change, 
-                oil_change_pct,
-                "🛢️"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Oil Price", 
-                f"{commodities_df['Oil'].max():.2f}",
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Oil Price", 
-                f"{commodities_df['Oil'].min():.2f}",
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Oil Price", 
-                f"{commodities_df['Oil'].mean():.2f}",
-                icon="📊"
-            ), unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # COPPER SECTION
-        styled_title("Copper Prices")
-        
-        # Copper Chart
-        fig_copper = go.Figure()
-        fig_copper.add_trace(go.Scatter(
-            x=commodities_df['Date'], 
-            y=commodities_df['Copper'], 
-            name="Copper Price", 
-            line=dict(color="#16a085", width=3)
-        ))
-        fig_copper.update_layout(
-            title="Copper Prices Over Time",
-            xaxis_title="Date",
-            yaxis_title="Price per Metric Ton ($)",
-            hovermode="x unified",
-            height=500,
-            template=plotly_template,
-            margin=dict(t=60, b=20)
-        )
-        st.plotly_chart(fig_copper, use_container_width=True)
-        
-        # Copper Metrics
-        latest_copper = commodities_df['Copper'].iloc[-1]
-        prev_copper = commodities_df['Copper'].iloc[-2] if len(commodities_df) > 1 else latest_copper
-        copper_change = latest_copper - prev_copper
-        copper_change_pct = (copper_change / prev_copper) * 100 if prev_copper != 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(create_metric_card(
-                "Latest Copper Price", 
-                f"{latest_copper:.2f}", 
-                copper_change, 
-                copper_change_pct,
-                "🔶"
-            ), unsafe_allow_html=True)
-        with col2:
-            st.markdown(create_metric_card(
-                "Max Copper Price", 
-                f"{commodities_df['Copper'].max():.2f}",
-                icon="📈"
-            ), unsafe_allow_html=True)
-        with col3:
-            st.markdown(create_metric_card(
-                "Min Copper Price", 
-                f"{commodities_df['Copper'].min():.2f}",
-                icon="📉"
-            ), unsafe_allow_html=True)
-        with col4:
-            st.markdown(create_metric_card(
-                "Avg. Copper Price", 
-                f"{commodities_df['Copper'].mean():.2f}",
-                icon="📊"
-            ), unsafe_allow_html=True)
-    else:
-        st.warning("No commodities data available")
-
-# === NEWS SENTIMENTS PAGE ===
-# === NEWS SENTIMENTS PAGE ===
-elif selected_page == "📰 News Sentiments":
-    styled_title("News Sentiment Analysis")
-    
-    if not sentiment_df.empty:
-        # Check for sentiment score column
-        sentiment_col = None
-        possible_sentiment_cols = ['sentiment_score', 'sentiment', 'score', 'sentiment score']
-        for col in possible_sentiment_cols:
-            if col in sentiment_df.columns:
-                sentiment_col = col
-                break
-        
-        if sentiment_col:
-            # --- 1. HISTOGRAM ---
-            fig_hist = px.histogram(
-                sentiment_df,
-                x=sentiment_col,
-                nbins=30,
-                title='Sentiment Score Distribution',
-                labels={sentiment_col: 'Sentiment Score', 'count': 'Count'},
-                color_discrete_sequence=[COLOR_SCHEME["primary"]]
-            )
-            
-            # Add reference lines
-            mean_score = sentiment_df[sentiment_col].mean()
-            fig_hist.add_vline(
-                x=0,
-                line_dash="dot",
-                line_color=COLOR_SCHEME["neutral"],
-                annotation_text="Neutral",
-                annotation_position="bottom right"
-            )
-            fig_hist.add_vline(
-                x=mean_score,
-                line_dash="dash",
-                line_color=COLOR_SCHEME["negative"],
-                annotation_text=f"Mean: {mean_score:.2f}",
-                annotation_position="top right"
-            )
-            
-            fig_hist.update_layout(
-                height=400,
-                template=plotly_template,
-                bargap=0.1
-            )
-            st.plotly_chart(fig_hist, use_container_width=True)
-            
-            # --- 2. METRIC BOXES ---
-            cols = st.columns(3)
-            with cols[0]:
-                st.markdown(create_metric_card(
-                    "Positive", 
-                    "600 (40.0%)",
-                    icon="👍"
-                ), unsafe_allow_html=True)
-            with cols[1]:
-                st.markdown(create_metric_card(
-                    "Neutral", 
-                    "500 (33.3%)",
-                    icon="😐"
-                ), unsafe_allow_html=True)
-            with cols[2]:
-                st.markdown(create_metric_card(
-                    "Negative", 
-                    "400 (26.7%)",
-                    icon="👎"
-                ), unsafe_allow_html=True)
-            
-            # Add spacing between metrics and pie chart
-            st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
-            
-            # --- 3. PIE CHART ---
-            pie_data = pd.DataFrame({
-                'sentiment': ['Positive', 'Neutral', 'Negative'],
-                'count': [600, 500, 400]
-            })
-            
-            fig_pie = px.pie(
-                pie_data,
-                names='sentiment',
-                values='count',
-                title='Sentiment Distribution',
-                color='sentiment',
-                color_discrete_map={
-                    'Positive': COLOR_SCHEME["positive"],
-                    'Neutral': COLOR_SCHEME["neutral"],
-                    'Negative': COLOR_SCHEME["negative"]
-                },
-                hole=0.3
-            )
-            
-            fig_pie.update_traces(
-                textinfo='percent+value',
-                textposition='inside',
-                marker=dict(line=dict(color='white', width=1))
-            )
-                
-            fig_pie.update_layout(
-                height=400,
-                template=plotly_template,
-                showlegend=False,
-                margin=dict(t=50, b=20)  # Added top margin for pie chart
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-            
-        else:
-            st.error(f"Sentiment column not found. Available columns: {', '.join(sentiment_df.columns)}")
-    else:
-        st.warning("No sentiment data loaded")
-# === FILTERED VISUALIZATIONS PAGE ===
 # === FILTERED VISUALIZATIONS PAGE ===
-elif selected_page == "📊 Filtered Visualizations":
+# The whole page body runs inside a fragment, so the filter selectboxes
+# rerun just this function - not the data loads and page dispatch above
+@st.fragment
+def filtered_visuals_page(financial_df, commodities_df):
     styled_title("Data Explorer with Filters")
-    
-    # Combine both datasets with source identification
-    financial_df['source'] = 'financial'
-    commodities_df['source'] = 'commodities'
-    combined_df = pd.concat([financial_df, commodities_df])
-    
-    # Extract month and year from date
-    combined_df['year'] = combined_df['Date'].dt.year
-    combined_df['month'] = combined_df['Date'].dt.month_name()
-    
+
+    # Combine both datasets with source identification (cached)
+    combined_df = build_combined(financial_df, commodities_df)
+
     # Create three columns for filters
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
         # Dataset selection
         dataset = st.selectbox(
@@ -1026,24 +575,15 @@ elif selected_page == "📊 Filtered Visualizations":
             options=["All", "Financial", "Commodities"],
             index=0
         )
-        
-        # Filter dataset
-        if dataset == "Financial":
-            filtered_df = combined_df[combined_df['source'] == 'financial']
-        elif dataset == "Commodities":
-            filtered_df = combined_df[combined_df['source'] == 'commodities']
-        else:
-            filtered_df = combined_df
-    
+
     with col2:
         # Column selection (excluding non-numeric and date columns)
-        numeric_cols = filtered_df.select_dtypes(include=['float64', 'int64']).columns.tolist()
         column = st.selectbox(
             "Select Metric to Visualize",
-            options=[col for col in numeric_cols if col not in ['year', 'month', 'source']],
+            options=numeric_columns(combined_df),
             index=0
         )
-    
+
     with col3:
         # Time aggregation selection
         time_agg = st.selectbox(
@@ -1051,72 +591,696 @@ elif selected_page == "📊 Filtered Visualizations":
             options=["Monthly", "Yearly"],
             index=0
         )
-    
+
     # Aggregate data based on time aggregation
     if time_agg == "Monthly":
         # Group by month only — averaging same months over all years
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        filtered_df['month'] = pd.Categorical(filtered_df['month'], categories=month_order, ordered=True)
-        
-        agg_df = filtered_df.groupby('month')[column].mean().reset_index()
-        
         x_col = 'month'
         title = f"Average Monthly {column} (Across Years)"
     else:
         # Yearly aggregation
-        agg_df = filtered_df.groupby('year')[column].mean().reset_index()
-        
         x_col = 'year'
         title = f"Yearly {column}"
+
+    # The batched aggregation runs once per time key and is cached;
+    # each metric pick just selects a column from it
+    agg = preagg(combined_df, x_col)[['source', x_col, column]].dropna(subset=[column])
+    if dataset == "Financial":
+        agg_df = agg[agg['source'] == 'financial']
+    elif dataset == "Commodities":
+        agg_df = agg[agg['source'] == 'commodities']
+    else:
+        agg_df = agg
+
+    # Create bar chart with darker color scale (cached per selection)
+    fig = make_bar(agg_df, x_col, column, title)
+
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART)
+
+    # Show raw data option
+    if st.checkbox("Show Aggregated Data Table"):
+        st.dataframe(agg_df.style.format(precision=2), height=300)
+
+# The dashboard body lives in main() so importing this module (e.g. from
+# tests) doesn't execute the UI. The loaders return cache_resource-backed
+# DataFrames shared across sessions - treat them as read-only.
+def main():
+    # Inject the shared styles once, before any page renders
+    inject_css()
+
+    # Load data
+    financial_df = load_financial_data()
+    commodities_df = load_commodities_data()
+    sentiment_df = load_sentiment_data()
+
+    # Sidebar navigation
+    st.sidebar.markdown(_SIDEBAR_HEADER, unsafe_allow_html=True)
+
+    pages = {
+        "📈 Financial Metrics": "metrics",
+        "📊 Data Explorer": "explorer",
+        "🛢️ Commodities & Macro": "commodities",
+        "📰 News Sentiments": "sentiments",
+        "📊 Filtered Visualizations": "filtered_visuals"  # Add this new line
+    }
+    selected_page = st.sidebar.radio("Navigation", list(pages.keys()))
+
+    # === FINANCIAL METRICS PAGE ===
+    if selected_page == "📈 Financial Metrics":
+        styled_title("Financial Performance Dashboard")
     
-    # Create bar chart with darker color scale
-    fig = px.bar(
-        agg_df,
-        x=x_col,
-        y=column,
-        title=title,
-        color=column,
-        color_continuous_scale=px.colors.sequential.Viridis,  # Darker color scale
-        labels={column: column, x_col: 'Time Period'}
-    )
-    
-    fig.update_layout(
-        height=500,
-        xaxis_title="Time Period",
-        yaxis_title=column,
-        template=plotly_template,
-        margin=dict(t=60, b=100),
-        coloraxis_showscale=True  # Show color scale legend for clarity
-    )
+        if not financial_df.empty:
+            fin_stats = column_stats(financial_df, FINANCIAL_COLS)
+            fin_dates = financial_df['Date'].to_numpy()
+            fin_series = {col: financial_df[col].to_numpy() for col in FINANCIAL_COLS}
+
+            # Summary cards at top
+            latest_date = financial_df['Date'].max().strftime('%b %Y')
+            st.markdown(_BANNER_TMPL.format(
+                f"<b>Scenario Analysis Active</b> | "
+                f"Years: {financial_df['Date'].min().year}-{financial_df['Date'].max().year} | "
+                f"Showing {len(financial_df)} of {len(financial_df)} records | Latest: {latest_date}"
+            ), unsafe_allow_html=True)
+        
+            # Calculate metrics for top cards
+            latest_rev = fin_stats['Total Revenue']['last']
+            prev_rev = fin_stats['Total Revenue']['prev']
+            rev_change = latest_rev - prev_rev
+            rev_change_pct = (rev_change / prev_rev) * 100 if prev_rev != 0 else 0
+        
+            latest_assets = fin_stats['Total Assets']['last']
+            avg_assets = fin_stats['Total Assets']['mean']
+        
+            latest_roe = fin_stats['Return on Equity']['last']
+            target_roe = 15.0
+        
+            rev_fmt = format_values([
+                latest_rev,
+                fin_stats['Total Revenue']['max'],
+                fin_stats['Total Revenue']['min'],
+                fin_stats['Total Revenue']['mean']
+            ])
+            card_row([
+                create_metric_card(
+                    "Latest Revenue", 
+                    rev_fmt[0], 
+                    rev_change, 
+                    rev_change_pct,
+                    "💰"
+                ),
+                create_metric_card(
+                    "Avg. Monthly Assets", 
+                    avg_assets,
+                    icon="🏦"
+                ),
+                create_metric_card(
+                    "Total Assets (Period)", 
+                    fin_stats['Total Assets']['sum'],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "ROE vs Target", 
+                    latest_roe,
+                    latest_roe - target_roe,
+                    ((latest_roe - target_roe)/target_roe)*100,
+                    "🎯"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # SECTION CHARTS
+            # One subplot figure for all six sections: a single serialization and
+            # a single Plotly.newPlot instead of six independent charts
+            fig_sections = make_subplots(
+                rows=6, cols=1, shared_xaxes=True,
+                subplot_titles=[
+                    "Total Assets Over Time",
+                    "Total Liabilities Over Time",
+                    "Total Revenue Over Time",
+                    "Long Term Debt Over Time",
+                    "Shareholder's Equity Over Time",
+                    "Return Metrics Over Time"
+                ],
+                vertical_spacing=0.04
+            )
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Total Assets'], 
+                name="Total Assets", 
+                line=dict(color=COLOR_SCHEME["primary"], width=3)
+            ), row=1, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Total Liabilities'], 
+                name="Total Liabilities", 
+                line=dict(color=COLOR_SCHEME["secondary"], width=3)
+            ), row=2, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Total Revenue'], 
+                name="Total Revenue", 
+                line=dict(color=COLOR_SCHEME["accent"], width=3)
+            ), row=3, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Long Term Debt'], 
+                name="Long Term Debt", 
+                line=dict(color="#8e44ad", width=3)
+            ), row=4, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Shareholders_Equity'], 
+                name="Shareholder's Equity", 
+                line=dict(color="#16a085", width=3)
+            ), row=5, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Return on Equity'], 
+                name="ROE", 
+                line=dict(color=COLOR_SCHEME["primary"], width=3)
+            ), row=6, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Return on Assets'], 
+                name="ROA", 
+                line=dict(color=COLOR_SCHEME["secondary"], width=3)
+            ), row=6, col=1)
+            fig_sections.add_trace(go.Scattergl(
+                x=fin_dates, 
+                y=fin_series['Return on Investment'], 
+                name="ROI", 
+                line=dict(color=COLOR_SCHEME["accent"], width=3)
+            ), row=6, col=1)
+            fig_sections.add_hline(
+                y=target_roe, 
+                line_dash="dot", 
+                line_color=COLOR_SCHEME["negative"],
+                annotation_text=f"Target ROE: {target_roe}%",
+                annotation_position="top right",
+                row=6, col=1
+            )
+            fig_sections.update_layout(**dict(BASE_LAYOUT, height=1800))
+            st.plotly_chart(fig_sections, use_container_width=True)
+        
+            st.markdown("---")
+        
+            # ASSETS SECTION
+            # Assets Metrics
+            prev_assets = fin_stats['Total Assets']['prev']
+            assets_change = latest_assets - prev_assets
+            assets_change_pct = (assets_change / prev_assets) * 100 if prev_assets != 0 else 0
+        
+            assets_fmt = format_values([
+                latest_assets,
+                fin_stats['Total Assets']['max'],
+                fin_stats['Total Assets']['min'],
+                fin_stats['Total Assets']['mean']
+            ])
+            render_section("Assets Analysis", [
+                create_metric_card(
+                    "Latest Assets", 
+                    assets_fmt[0], 
+                    assets_change, 
+                    assets_change_pct,
+                    "🏦"
+                ),
+                create_metric_card(
+                    "Max Assets", 
+                    assets_fmt[1],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Assets", 
+                    assets_fmt[2],
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Assets", 
+                    assets_fmt[3],
+                    icon="📊"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # LIABILITIES SECTION
+            # Liabilities Metrics
+            latest_liab = fin_stats['Total Liabilities']['last']
+            prev_liab = fin_stats['Total Liabilities']['prev']
+            liab_change = latest_liab - prev_liab
+            liab_change_pct = (liab_change / prev_liab) * 100 if prev_liab != 0 else 0
+        
+            liab_fmt = format_values([
+                latest_liab,
+                fin_stats['Total Liabilities']['max'],
+                fin_stats['Total Liabilities']['min'],
+                fin_stats['Total Liabilities']['mean']
+            ])
+            render_section("Liabilities Analysis", [
+                create_metric_card(
+                    "Latest Liabilities", 
+                    liab_fmt[0], 
+                    liab_change, 
+                    liab_change_pct,
+                    "🏦"
+                ),
+                create_metric_card(
+                    "Max Liabilities", 
+                    liab_fmt[1],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Liabilities", 
+                    liab_fmt[2],
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Liabilities", 
+                    liab_fmt[3],
+                    icon="📊"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # REVENUE SECTION
+            # Revenue Metrics
+            render_section("Revenue Analysis", [
+                create_metric_card(
+                    "Latest Revenue", 
+                    latest_rev, 
+                    rev_change, 
+                    rev_change_pct,
+                    "💰"
+                ),
+                create_metric_card(
+                    "Max Revenue", 
+                    rev_fmt[1],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Revenue", 
+                    rev_fmt[2],
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Revenue", 
+                    rev_fmt[3],
+                    icon="📊"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # DEBT SECTION
+            # Debt Metrics
+            latest_debt = fin_stats['Long Term Debt']['last']
+            prev_debt = fin_stats['Long Term Debt']['prev']
+            debt_change = latest_debt - prev_debt
+            debt_change_pct = (debt_change / prev_debt) * 100 if prev_debt != 0 else 0
+        
+            debt_fmt = format_values([
+                latest_debt,
+                fin_stats['Long Term Debt']['max'],
+                fin_stats['Long Term Debt']['min'],
+                fin_stats['Long Term Debt']['mean']
+            ])
+            render_section("Debt Analysis", [
+                create_metric_card(
+                    "Latest Debt", 
+                    debt_fmt[0], 
+                    debt_change, 
+                    debt_change_pct,
+                    "🏦"
+                ),
+                create_metric_card(
+                    "Max Debt", 
+                    debt_fmt[1],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Debt", 
+                    debt_fmt[2],
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Debt", 
+                    debt_fmt[3],
+                    icon="📊"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # EQUITY SECTION
+            # Equity Metrics
+            latest_equity = fin_stats['Shareholders_Equity']['last']
+            prev_equity = fin_stats['Shareholders_Equity']['prev']
+            equity_change = latest_equity - prev_equity
+            equity_change_pct = (equity_change / prev_equity) * 100 if prev_equity != 0 else 0
+        
+            equity_fmt = format_values([
+                latest_equity,
+                fin_stats['Shareholders_Equity']['max'],
+                fin_stats['Shareholders_Equity']['min'],
+                fin_stats['Shareholders_Equity']['mean']
+            ])
+            render_section("Equity Analysis", [
+                create_metric_card(
+                    "Latest Equity", 
+                    equity_fmt[0], 
+                    equity_change, 
+                    equity_change_pct,
+                    "🏦"
+                ),
+                create_metric_card(
+                    "Max Equity", 
+                    equity_fmt[1],
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Equity", 
+                    equity_fmt[2],
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Equity", 
+                    equity_fmt[3],
+                    icon="📊"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # RETURN METRICS SECTION
+            # Return Metrics
+            latest_roa = fin_stats['Return on Assets']['last']
+            latest_roi = fin_stats['Return on Investment']['last']
+        
+            render_section("Return Metrics Analysis", [
+                create_metric_card(
+                    "Latest ROE", 
+                    latest_roe,
+                    icon="📊"
+                ),
+                create_metric_card(
+                    "Latest ROA", 
+                    latest_roa,
+                    icon="📊"
+                ),
+                create_metric_card(
+                    "Latest ROI", 
+                    latest_roi,
+                    icon="📊"
+                ),
+            ])
+        else:
+            st.warning("No financial data available")
+
+    # === DATA EXPLORER PAGE ===
+    elif selected_page == "📊 Data Explorer":
+        styled_title("Financial Data Explorer")
     
-    # Rotate x-axis labels for better readability
-    fig.update_xaxes(tickangle=45)
+        if not financial_df.empty:
+            # Display and filter data
+            st.dataframe(explorer_table(financial_df), height=600)
+        else:
+            st.warning("No financial data available")
+
+    # === COMMODITIES & MACRO PAGE ===
+    elif selected_page == "🛢️ Commodities & Macro":
+        styled_title("Commodities & Macroeconomic Factors Dashboard")
     
-    st.plotly_chart(fig, use_container_width=True)
+        if not commodities_df.empty:
+            com_stats = column_stats(commodities_df, COMMODITY_COLS)
+            com_dates = commodities_df['Date'].to_numpy()
+            com_series = {col: commodities_df[col].to_numpy() for col in COMMODITY_COLS}
+
+            latest_date = commodities_df['Date'].max().strftime('%b %Y')
+            st.markdown(_BANNER_TMPL.format(
+                f"Showing {len(commodities_df)} records | Latest: {latest_date}"
+            ), unsafe_allow_html=True)
+        
+            # Calculate metrics for top cards
+            latest_cpi = com_stats['CPI']['last']
+            prev_cpi = com_stats['CPI']['prev']
+            cpi_change = latest_cpi - prev_cpi
+            cpi_change_pct = (cpi_change / prev_cpi) * 100 if prev_cpi != 0 else 0
+        
+            latest_gdp = com_stats['GDP']['last']
+            avg_gdp = com_stats['GDP']['mean']
+        
+            latest_oil = com_stats['Oil']['last']
+            latest_copper = com_stats['Copper']['last']
+        
+            card_row([
+                create_metric_card(
+                    "Latest CPI", 
+                    f"{latest_cpi:.2f}", 
+                    cpi_change, 
+                    cpi_change_pct,
+                    "📉"
+                ),
+                create_metric_card(
+                    "Avg. GDP", 
+                    f"{avg_gdp:,.2f}",
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Oil Price", 
+                    f"{latest_oil:.2f}",
+                    icon="🛢️"
+                ),
+                create_metric_card(
+                    "Copper Price", 
+                    f"{latest_copper:.2f}",
+                    icon="🔶"
+                ),
+            ])
+        
+            st.markdown("---")
+        
+            # CPI SECTION
+            # CPI Chart
+            fig_cpi = go.Figure(layout=dict(
+                BASE_LAYOUT,
+                title="CPI Over Time",
+                xaxis_title="Date",
+                yaxis_title="Index Value"
+            ))
+            fig_cpi.add_trace(go.Scattergl(
+                x=com_dates, 
+                y=com_series['CPI'], 
+                name="CPI", 
+                line=dict(color=COLOR_SCHEME["primary"], width=3)
+            ))
+            # CPI Metrics
+            render_section("Consumer Price Index (CPI)", [
+                create_metric_card(
+                    "Latest CPI", 
+                    f"{latest_cpi:.2f}", 
+                    cpi_change, 
+                    cpi_change_pct,
+                    "📉"
+                ),
+                create_metric_card(
+                    "Max CPI", 
+                    f"{com_stats['CPI']['max']:.2f}",
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min CPI", 
+                    f"{com_stats['CPI']['min']:.2f}",
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. CPI", 
+                    f"{com_stats['CPI']['mean']:.2f}",
+                    icon="📊"
+                ),
+            ], fig=fig_cpi)
+        
+            st.markdown("---")
+        
+            # GDP SECTION
+            # GDP Chart
+            fig_gdp = go.Figure(layout=dict(
+                BASE_LAYOUT,
+                title="GDP Over Time",
+                xaxis_title="Date",
+                yaxis_title="Value"
+            ))
+            fig_gdp.add_trace(go.Scattergl(
+                x=com_dates, 
+                y=com_series['GDP'], 
+                name="GDP", 
+                line=dict(color=COLOR_SCHEME["secondary"], width=3)
+            ))
+            # GDP Metrics
+            latest_gdp = com_stats['GDP']['last']
+            prev_gdp = com_stats['GDP']['prev']
+            gdp_change = latest_gdp - prev_gdp
+            gdp_change_pct = (gdp_change / prev_gdp) * 100 if prev_gdp != 0 else 0
+        
+            render_section("Gross Domestic Product (GDP)", [
+                create_metric_card(
+                    "Latest GDP", 
+                    f"{latest_gdp:,.2f}", 
+                    gdp_change, 
+                    gdp_change_pct,
+                    "📈"
+                ),
+                create_metric_card(
+                    "Max GDP", 
+                    f"{com_stats['GDP']['max']:,.2f}",
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min GDP", 
+                    f"{com_stats['GDP']['min']:,.2f}",
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. GDP", 
+                    f"{com_stats['GDP']['mean']:,.2f}",
+                    icon="📊"
+                ),
+            ], fig=fig_gdp)
+        
+            st.markdown("---")
+        
+            # OIL SECTION
+            # Oil Chart
+            fig_oil = go.Figure(layout=dict(
+                BASE_LAYOUT,
+                title="Oil Prices Over Time",
+                xaxis_title="Date",
+                yaxis_title="Price per Barrel ($)"
+            ))
+            fig_oil.add_trace(go.Scattergl(
+                x=com_dates, 
+                y=com_series['Oil'], 
+                name="Oil Price", 
+                line=dict(color="#8e44ad", width=3)
+            ))
+            # Oil Metrics
+            latest_oil = com_stats['Oil']['last']
+            prev_oil = com_stats['Oil']['prev']
+            oil_change = latest_oil - prev_oil
+            oil_change_pct = (oil_change / prev_oil) * 100 if prev_oil != 0 else 0
+        
+            render_section("Oil Prices", [
+                create_metric_card(
+                    "Latest Oil Price", 
+                    f"{latest_oil:.2f}", 
+                    oil_change, 
+                    oil_change_pct,
+                    "🛢️"
+                ),
+                create_metric_card(
+                    "Max Oil Price", 
+                    f"{com_stats['Oil']['max']:.2f}",
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Oil Price", 
+                    f"{com_stats['Oil']['min']:.2f}",
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Oil Price", 
+                    f"{com_stats['Oil']['mean']:.2f}",
+                    icon="📊"
+                ),
+            ], fig=fig_oil)
+        
+            st.markdown("---")
+        
+            # COPPER SECTION
+            # Copper Chart
+            fig_copper = go.Figure(layout=dict(
+                BASE_LAYOUT,
+                title="Copper Prices Over Time",
+                xaxis_title="Date",
+                yaxis_title="Price per Metric Ton ($)"
+            ))
+            fig_copper.add_trace(go.Scattergl(
+                x=com_dates, 
+                y=com_series['Copper'], 
+                name="Copper Price", 
+                line=dict(color="#16a085", width=3)
+            ))
+            # Copper Metrics
+            latest_copper = com_stats['Copper']['last']
+            prev_copper = com_stats['Copper']['prev']
+            copper_change = latest_copper - prev_copper
+            copper_change_pct = (copper_change / prev_copper) * 100 if prev_copper != 0 else 0
+        
+            render_section("Copper Prices", [
+                create_metric_card(
+                    "Latest Copper Price", 
+                    f"{latest_copper:.2f}", 
+                    copper_change, 
+                    copper_change_pct,
+                    "🔶"
+                ),
+                create_metric_card(
+                    "Max Copper Price", 
+                    f"{com_stats['Copper']['max']:.2f}",
+                    icon="📈"
+                ),
+                create_metric_card(
+                    "Min Copper Price", 
+                    f"{com_stats['Copper']['min']:.2f}",
+                    icon="📉"
+                ),
+                create_metric_card(
+                    "Avg. Copper Price", 
+                    f"{com_stats['Copper']['mean']:.2f}",
+                    icon="📊"
+                ),
+            ], fig=fig_copper)
+        else:
+            st.warning("No commodities data available")
+
+    # === NEWS SENTIMENTS PAGE ===
+    # === NEWS SENTIMENTS PAGE ===
+    elif selected_page == "📰 News Sentiments":
+        styled_title("News Sentiment Analysis")
     
-    # Show raw data option
-    if st.checkbox("Show Aggregated Data Table"):
-        st.dataframe(agg_df.style.format(precision=2), height=300)
+        if not sentiment_df.empty:
+            # Check for sentiment score column (cached along with its mean)
+            sentiment_col, mean_score = sentiment_meta(sentiment_df)
 
-# Custom CSS
-st.markdown(f"""
-    <style>
-        .stApp {{
-            background-color: {COLOR_SCHEME["background"]};
-        }}
-        .stPlotlyChart {{
-            border-radius: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            padding: 15px;
-            background-color: {COLOR_SCHEME["card_background"]};
-        }}
-        .css-1v3fvcr {{
-            padding-top: 1.5rem;
-        }}
-        .stDataFrame {{
-            border-radius: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-    </style>
-""", unsafe_allow_html=True)
+            if sentiment_col:
+                # --- 1. HISTOGRAM ---
+                fig_hist = make_hist(sentiment_df, sentiment_col, mean_score)
+                st.plotly_chart(fig_hist, use_container_width=True)
+            
+                # --- 2. METRIC BOXES ---
+                pos, neu, neg = sentiment_buckets(sentiment_df, sentiment_col)
+                total = pos + neu + neg
+                card_row([
+                    create_metric_card("Positive", f"{pos} ({pos / total:.1%})", icon="👍"),
+                    create_metric_card("Neutral", f"{neu} ({neu / total:.1%})", icon="😐"),
+                    create_metric_card("Negative", f"{neg} ({neg / total:.1%})", icon="👎"),
+                ])
+            
+                # Add spacing between metrics and pie chart
+                st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+            
+                # --- 3. PIE CHART ---
+                fig_pie = make_pie((pos, neu, neg))
+                st.plotly_chart(fig_pie, use_container_width=True, config=STATIC_CHART)
+            
+            else:
+                st.error(f"Sentiment column not found. Available columns: {', '.join(sentiment_df.columns)}")
+        else:
+            st.warning("No sentiment data loaded")
+    # === FILTERED VISUALIZATIONS PAGE ===
+    elif selected_page == "📊 Filtered Visualizations":
+        filtered_visuals_page(financial_df, commodities_df)
+
+if __name__ == '__main__':
+    main()